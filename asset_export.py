@@ -0,0 +1,181 @@
+# asset_export.py
+import os
+import json
+import shutil
+import datetime
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt5.QtCore import QObject, pyqtSignal
+
+# ─────────────────────────────────────────────────────────────
+# 선택한 어셈블리 하위 자산 일괄 내보내기
+# ─────────────────────────────────────────────────────────────
+EXPORT_FOLDERS = {            # 자산 종류 -> 내보내기 하위 폴더 (원본 폴더명과 동일)
+    "image": "00_image",
+    "xml3d": "02_3dxml",
+    "fbx": "03_fbx",
+}
+COPY_BUFFER_SIZE = 1024 * 1024   # ZIP 스트리밍 버퍼 (1MB)
+MANIFEST_NAME = "manifest.json"
+
+
+def collect_subtree_parts(item):
+    """선택한 노드와 모든 하위 노드의 파트넘버 (대문자, 중복 제거, 트리 순서 유지)"""
+    part_numbers = {}
+    stack = [item]
+    while stack:
+        node = stack.pop()
+        part_numbers.setdefault(node.text(0).strip().upper(), None)
+        stack.extend(node.child(i) for i in range(node.childCount() - 1, -1, -1))
+    return list(part_numbers)
+
+
+def collect_export_jobs(part_numbers, asset_index):
+    """
+    파트넘버 목록을 asset_index로 해석하여 내보낼 파일 목록 생성.
+    현재 선택된 후보만이 아니라 파트의 모든 파일(리비전, 뷰)을 내보냄.
+    반환값: (작업 리스트 [(파트, 종류, 원본 경로, ZIP/폴더 내 상대 경로)], 자산이 없는 파트 리스트)
+    """
+    jobs = []
+    missing = []
+    seen_sources = set()
+    for part_number in part_numbers:
+        found = False
+        for kind, folder_name in EXPORT_FOLDERS.items():
+            for source in asset_index.alternatives(kind, part_number):
+                found = True
+                if source in seen_sources:
+                    continue
+                seen_sources.add(source)
+                jobs.append((part_number, kind, source, f"{folder_name}/{os.path.basename(source)}"))
+        if not found:
+            missing.append(part_number)
+    return jobs, missing
+
+
+class AssetExporter(QObject):
+    """
+    내보내기 작업을 백그라운드 스레드에서 실행.
+    폴더 내보내기는 스레드 풀 + shutil.copyfile(플랫폼별 고속 복사 경로 사용),
+    ZIP 내보내기는 단일 스트림에 큰 버퍼로 순차 기록(무압축: 이미지/3DXML은 이미 압축됨).
+    끝나면 manifest.json을 기록하고 finished 시그널로 매니페스트를 전달.
+    """
+    progress = pyqtSignal(int, int)   # (완료 파일 수, 전체 파일 수)
+    finished = pyqtSignal(dict)       # 매니페스트
+
+    def __init__(self, root_part, jobs, missing, destination, as_zip=False, workers=4, parent=None):
+        super().__init__(parent)
+        self.root_part = root_part
+        self.jobs = jobs
+        self.missing = missing
+        self.destination = destination
+        self.as_zip = as_zip
+        self.workers = workers
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def _run(self):
+        try:
+            if self.as_zip:
+                entries = self._export_zip()
+            else:
+                entries = self._export_folder()
+            error = None
+        except Exception as e:
+            entries = []
+            error = str(e)
+
+        manifest = self._manifest(entries, error)
+        if not self.as_zip and error is None:
+            try:
+                with open(os.path.join(self.destination, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+                    json.dump(manifest, f, ensure_ascii=False, indent=4)
+            except OSError as e:
+                manifest["error"] = str(e)
+        self.finished.emit(manifest)
+
+    def _manifest(self, entries, error=None):
+        return {
+            "root": self.root_part,
+            "created": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "destination": self.destination,
+            "cancelled": self.is_cancelled(),
+            "error": error,
+            "files": entries,
+            "missing_parts": self.missing,
+        }
+
+    def _entry(self, job, status, size=0):
+        part_number, kind, source, target = job
+        return {"part": part_number, "kind": kind, "source": source,
+                "target": target, "size": size, "status": status}
+
+    def _copy_one(self, job):
+        if self.is_cancelled():
+            return self._entry(job, "cancelled")
+        target = os.path.join(self.destination, *job[3].split("/"))
+        try:
+            shutil.copyfile(job[2], target)
+            return self._entry(job, "copied", os.path.getsize(target))
+        except OSError as e:
+            return self._entry(job, f"error: {e}")
+
+    def _export_folder(self):
+        for folder_name in {job[3].split("/")[0] for job in self.jobs}:
+            os.makedirs(os.path.join(self.destination, folder_name), exist_ok=True)
+
+        total = len(self.jobs)
+        entries = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._copy_one, job) for job in self.jobs]
+            for future in as_completed(futures):
+                entries.append(future.result())
+                self.progress.emit(len(entries), total)
+                if self.is_cancelled():
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    break
+        entries.sort(key=lambda entry: entry["target"])
+        return entries
+
+    def _export_zip(self):
+        total = len(self.jobs)
+        entries = []
+        with zipfile.ZipFile(self.destination, "w", zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for done, job in enumerate(self.jobs, 1):
+                if self.is_cancelled():
+                    break
+                try:
+                    with open(job[2], "rb") as fsrc, zf.open(job[3], "w", force_zip64=True) as fdst:
+                        while True:
+                            chunk = fsrc.read(COPY_BUFFER_SIZE)
+                            if not chunk:
+                                break
+                            fdst.write(chunk)
+                            if self.is_cancelled():
+                                break
+                    entries.append(self._entry(job, "copied", zf.getinfo(job[3]).file_size))
+                except OSError as e:
+                    entries.append(self._entry(job, f"error: {e}"))
+                self.progress.emit(done, total)
+
+            if not self.is_cancelled():
+                zf.writestr(MANIFEST_NAME, json.dumps(self._manifest(entries), ensure_ascii=False, indent=4))
+
+        # 취소된 ZIP은 불완전하므로 삭제
+        if self.is_cancelled():
+            try:
+                os.remove(self.destination)
+            except OSError:
+                pass
+        return entries
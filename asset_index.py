@@ -0,0 +1,227 @@
+# asset_index.py
+import os
+import re
+from array import array
+from collections.abc import Mapping
+
+# ─────────────────────────────────────────────────────────────
+# 자산 종류 (files_dict 키와 동일)
+# ─────────────────────────────────────────────────────────────
+ASSET_KINDS = ("image", "xml3d", "fbx")
+
+# 리비전으로 인정하는 토큰: REV3 / R3 / 3, REV_B / REVB / B / AB
+_NUMERIC_REV = re.compile(r"^(?:REV[-_.]?|R)?(\d+)$")
+_LETTER_REV = re.compile(r"^(?:REV[-_.]?)?([A-Z]{1,2})$")
+
+
+def parse_asset_name(fname):
+    """
+    파일명 aaa_bbb_ccc_PARTNO[_REV].ext 를 분해.
+    반환값: (접두 필드 튜플, PARTNO(대문자), 리비전 문자열) / 규칙에 맞지 않으면 None
+    """
+    stem = os.path.splitext(os.path.basename(fname))[0]
+    fields = stem.split("_")
+    if len(fields) < 4:
+        return None
+    part_number = fields[3].strip().upper()
+    if not part_number:
+        return None
+    revision = "_".join(fields[4:]).strip().upper()
+    return tuple(fields[:3]), part_number, revision
+
+
+def revision_key(revision):
+    """
+    리비전 정렬 키 (클수록 최신).
+    숫자 리비전은 숫자로, 문자 리비전(1~2자)은 길이→사전순으로 비교 (A < B < ... < Z < AA).
+    접미사 전체 또는 첫 토큰이 리비전 형식일 때만 인정하고,
+    리비전이 없거나 FRONT/V2 같은 뷰 이름이면 중립 키를 주어 mtime 순으로 정렬되게 함.
+    """
+    for token in (revision, revision.split("_")[0]):
+        match = _NUMERIC_REV.match(token)
+        if match:
+            return (1, int(match.group(1)), 0, "")
+        match = _LETTER_REV.match(token)
+        if match:
+            letters = match.group(1)
+            return (1, 0, len(letters), letters)
+    return (0, 0, 0, "")
+
+
+class _AssetTable:
+    """
+    한 종류(kind)의 파일 레코드 저장소.
+    폴더 경로는 한 번만 저장하고, 레코드는 파일명 리스트 + array 로 보관하여
+    10만 개 이상의 파일에서도 메모리 사용을 줄임.
+    """
+    __slots__ = ("folders", "names", "folder_ids", "mtimes", "parts", "cursors", "fuzzy_count")
+
+    def __init__(self):
+        self.folders = []              # 폴더 경로 목록
+        self.names = []                # 레코드 id -> 파일명
+        self.folder_ids = array("I")   # 레코드 id -> 폴더 id
+        self.mtimes = array("d")       # 레코드 id -> 수정 시간
+        self.parts = {}                # 파트넘버 -> 레코드 id 튜플 (최선 후보가 맨 앞)
+        self.cursors = {}              # 파트넘버 -> 현재 선택된 후보 위치 (0이 아닌 것만 저장)
+        self.fuzzy_count = 0           # 명명 규칙 밖이라 퍼지 매칭으로 연결된 파일 수
+
+    def path(self, record_id):
+        return os.path.join(self.folders[self.folder_ids[record_id]], self.names[record_id])
+
+
+class AssetIndex:
+    """
+    파트넘버별로 모든 자산 파일을 보관하는 인덱스.
+    후보는 최신 리비전 → 최신 mtime → 파일명 순으로 결정적으로 정렬되며,
+    현재 선택된 후보 조회는 O(1), cycle()로 다음 후보로 전환할 수 있음.
+    """
+
+    def __init__(self):
+        self._tables = {kind: _AssetTable() for kind in ASSET_KINDS}
+
+    def clear(self, kind):
+        self._tables[kind] = _AssetTable()
+
+    def scan_folder(self, kind, folder_path, extensions, resolver=None, is_known=None):
+        """
+        폴더를 스캔하여 kind 테이블을 다시 구성.
+        resolver: 명명 규칙에 맞지 않는 파일명(확장자 제외) -> 파트넘버 또는 None.
+                  지정하면 규칙 밖 파일도 해당 파트에 연결함.
+        is_known: 파트넘버 -> BOM에 있는지 여부. 규칙대로 파싱한 파트넘버가 BOM에 없으면
+                  (예: ACME_85N0056-005_REV_B_front → 'B') resolver 결과를 우선 사용.
+        반환값: 인덱싱된 파일 수
+        """
+        table = _AssetTable()
+        table.folders.append(folder_path)
+        grouped = {}  # 파트넘버 -> [(정렬 키, 파일명, 레코드 id), ...]
+
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                lower_name = entry.name.lower()
+                if not lower_name.endswith(extensions) or not entry.is_file():
+                    continue
+                parsed = parse_asset_name(entry.name)
+                resolved = None
+                if resolver is not None and (
+                    parsed is None or (is_known is not None and not is_known(parsed[1]))
+                ):
+                    resolved = resolver(os.path.splitext(entry.name)[0])
+                if resolved:
+                    part_number, revision = resolved.upper(), ""
+                    table.fuzzy_count += 1
+                elif parsed is not None:
+                    _, part_number, revision = parsed
+                else:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    mtime = 0.0
+                record_id = len(table.names)
+                table.names.append(entry.name)
+                table.folder_ids.append(0)
+                table.mtimes.append(mtime)
+                grouped.setdefault(part_number, []).append(
+                    ((revision_key(revision), mtime), entry.name, record_id)
+                )
+
+        for part_number, candidates in grouped.items():
+            # 파일명 오름차순으로 먼저 정렬한 뒤 (리비전, mtime) 내림차순 안정 정렬
+            candidates.sort(key=lambda c: c[1])
+            candidates.sort(key=lambda c: c[0], reverse=True)
+            table.parts[part_number] = tuple(c[2] for c in candidates)
+
+        self._tables[kind] = table
+        return len(table.names)
+
+    # ─── 조회 ─────────────────────────────────────────────
+    def __contains__(self, key):
+        kind, part_number = key
+        return part_number in self._tables[kind].parts
+
+    def count(self, kind, part_number):
+        """파트의 후보 파일 수"""
+        return len(self._tables[kind].parts.get(part_number, ()))
+
+    def best(self, kind, part_number):
+        """가장 우선순위가 높은 파일 경로 (없으면 None)"""
+        table = self._tables[kind]
+        record_ids = table.parts.get(part_number)
+        if not record_ids:
+            return None
+        return table.path(record_ids[0])
+
+    def current(self, kind, part_number):
+        """현재 선택된 후보 파일 경로 (cycle 전에는 best와 같음)"""
+        table = self._tables[kind]
+        record_ids = table.parts.get(part_number)
+        if not record_ids:
+            return None
+        return table.path(record_ids[table.cursors.get(part_number, 0)])
+
+    def current_position(self, kind, part_number):
+        """현재 선택 위치 (0부터)"""
+        return self._tables[kind].cursors.get(part_number, 0)
+
+    def alternatives(self, kind, part_number):
+        """모든 후보 파일 경로 (우선순위 순)"""
+        table = self._tables[kind]
+        return [table.path(record_id) for record_id in table.parts.get(part_number, ())]
+
+    def cycle(self, kind, part_number, step=1):
+        """다음 후보로 전환하고 그 경로를 반환 (후보가 없으면 None)"""
+        table = self._tables[kind]
+        record_ids = table.parts.get(part_number)
+        if not record_ids:
+            return None
+        position = (table.cursors.get(part_number, 0) + step) % len(record_ids)
+        if position:
+            table.cursors[part_number] = position
+        else:
+            table.cursors.pop(part_number, None)
+        return table.path(record_ids[position])
+
+    def part_numbers(self, kind):
+        return self._tables[kind].parts.keys()
+
+    def paths(self, kind):
+        """kind의 모든 파일 경로 (대체 후보 포함)"""
+        table = self._tables[kind]
+        return [table.path(record_id) for record_id in range(len(table.names))]
+
+    def file_count(self, kind):
+        return len(self._tables[kind].names)
+
+    def fuzzy_count(self, kind):
+        return self._tables[kind].fuzzy_count
+
+    def view(self, kind):
+        """files_dict 호환용 읽기 전용 매핑 (파트넘버 -> 현재 선택된 파일 경로)"""
+        return AssetView(self, kind)
+
+
+class AssetView(Mapping):
+    """
+    AssetIndex 위의 dict 형태 뷰.
+    기존 코드의 `part in files_dict[kind]`, `files_dict[kind][part]` 를 그대로 지원.
+    """
+    __slots__ = ("_index", "_kind")
+
+    def __init__(self, index, kind):
+        self._index = index
+        self._kind = kind
+
+    def __getitem__(self, part_number):
+        path = self._index.current(self._kind, part_number)
+        if path is None:
+            raise KeyError(part_number)
+        return path
+
+    def __contains__(self, part_number):
+        return (self._kind, part_number) in self._index
+
+    def __iter__(self):
+        return iter(self._index.part_numbers(self._kind))
+
+    def __len__(self):
+        return len(self._index.part_numbers(self._kind))
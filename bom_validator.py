@@ -0,0 +1,210 @@
+# bom_validator.py
+import time
+import numpy as np
+import pandas as pd
+
+# ─────────────────────────────────────────────────────────────
+# BOM(PartNo / NextPart) 무결성 검사
+# 모든 검사는 pandas/NumPy 벡터 연산으로 처리하며, 반복 횟수는
+# 행 수가 아니라 트리 깊이에만 비례함.
+# ─────────────────────────────────────────────────────────────
+
+
+class BomReport:
+    """validate_bom 결과 (구조화된 검사 리포트)"""
+
+    def __init__(self):
+        self.total_rows = 0
+        self.empty_rows = 0          # 파트넘버가 비어 있거나 'nan'인 행 수
+        self.roots = []              # NextPart가 없는 파트 (최종 루트 후보)
+        self.dangling_parents = {}   # 존재하지 않는 부모 -> 그 부모를 가리키는 자식 목록
+        self.orphans = []            # 어떤 루트에서도 도달할 수 없는 파트
+        self.cycles = []             # 순환 참조에 포함된 파트
+        self.duplicates = []         # (파트, 부모, 중복 횟수)
+        self.unknown_assets = {}     # 자산 종류 -> BOM에 없는 파트넘버 목록
+        self.elapsed = 0.0
+
+    @property
+    def has_multiple_roots(self):
+        return len(self.roots) > 1
+
+    def has_issues(self):
+        return bool(
+            self.has_multiple_roots or not self.roots or self.dangling_parents
+            or self.orphans or self.cycles or self.duplicates
+            or any(self.unknown_assets.values())
+        )
+
+    def to_dict(self):
+        return {
+            "total_rows": self.total_rows,
+            "empty_rows": self.empty_rows,
+            "roots": list(self.roots),
+            "dangling_parents": {k: list(v) for k, v in self.dangling_parents.items()},
+            "orphans": list(self.orphans),
+            "cycles": list(self.cycles),
+            "duplicates": [list(d) for d in self.duplicates],
+            "unknown_assets": {k: list(v) for k, v in self.unknown_assets.items()},
+            "elapsed": self.elapsed,
+        }
+
+    def summary_lines(self, limit=10):
+        """로그 출력용 요약 (각 항목은 최대 limit개까지 나열)"""
+        def preview(values):
+            values = list(values)
+            text = ", ".join(str(v) for v in values[:limit])
+            if len(values) > limit:
+                text += f" ... (+{len(values) - limit})"
+            return text
+
+        lines = ["===== BOM Validation ====="]
+        lines.append(f"검사 행 수: {self.total_rows} (빈 파트넘버 {self.empty_rows})")
+        if not self.roots:
+            lines.append("최종 루트가 없습니다.")
+        elif self.has_multiple_roots:
+            lines.append(f"최종 루트가 여러 개입니다 ({len(self.roots)}): {preview(self.roots)}")
+        if self.dangling_parents:
+            lines.append(
+                f"존재하지 않는 NextPart ({len(self.dangling_parents)}): "
+                f"{preview(self.dangling_parents)}"
+            )
+        if self.orphans:
+            lines.append(f"트리에 연결되지 않는 파트 ({len(self.orphans)}): {preview(self.orphans)}")
+        if self.cycles:
+            lines.append(f"순환 참조 파트 ({len(self.cycles)}): {preview(self.cycles)}")
+        if self.duplicates:
+            lines.append(
+                f"중복 파트/부모 행 ({len(self.duplicates)}): "
+                f"{preview(f'{p}<-{n} x{c}' for p, n, c in self.duplicates)}"
+            )
+        for kind, parts in self.unknown_assets.items():
+            if len(parts):
+                lines.append(f"BOM에 없는 {kind} 자산 ({len(parts)}): {preview(parts)}")
+        lines.append(f"검사 시간: {self.elapsed:.3f} seconds")
+        return lines
+
+
+def _empty_mask(values):
+    """빈 문자열 또는 'nan' 여부 (벡터 연산)"""
+    return (values == "") | (values.str.lower() == "nan")
+
+
+def _peel(alive, src, dst, n):
+    """
+    간선 src -> dst 에서 나가는 간선이 없는 노드를 반복적으로 제거 (Kahn 방식).
+    남은 노드(alive)를 반환. 반복 횟수는 그래프 깊이에 비례.
+    """
+    alive = alive.copy()
+    active = alive[src] & alive[dst]
+    out_degree = np.bincount(src[active], minlength=n)
+    while True:
+        leaves = alive & (out_degree == 0)
+        if not leaves.any():
+            return alive
+        alive[leaves] = False
+        removed = active & leaves[dst]
+        active &= ~removed
+        out_degree -= np.bincount(src[removed], minlength=n)
+
+
+def _propagate_min(remaining, src, dst, n):
+    """남은 노드마다 src -> dst 방향으로 도달 가능한 최소 노드 번호 (제거된 노드는 n)"""
+    label = np.where(remaining, np.arange(n), n)
+    while True:
+        updated = label.copy()
+        np.minimum.at(updated, src, label[dst])
+        if np.array_equal(updated, label):
+            return label
+        label = updated
+
+
+def _strong_components(alive, src, dst, n):
+    """
+    남은 노드의 강한 연결 요소 라벨 (요소 안의 최소 노드 번호, 제거된 노드는 -1).
+    양방향 최소 번호 전파 결과가 같은 노드는 그 번호의 노드와 서로 도달 가능하므로
+    같은 요소로 확정하고 제거, 남은 노드가 없을 때까지 반복.
+    """
+    labels = np.full(n, -1)
+    remaining = alive.copy()
+    while remaining.any():
+        active = remaining[src] & remaining[dst]
+        forward = _propagate_min(remaining, src[active], dst[active], n)
+        backward = _propagate_min(remaining, dst[active], src[active], n)
+        found = remaining & (forward == backward)
+        labels[found] = forward[found]
+        remaining &= ~found
+    return labels
+
+
+def validate_bom(part_nos, next_parts, asset_parts=None):
+    """
+    PartNo / NextPart 시리즈(문자열, strip 처리된 것)를 검사하여 BomReport 반환.
+    asset_parts: {자산 종류: 파트넘버 iterable} (대문자 파트넘버 기준으로 비교)
+    """
+    start_time = time.time()
+    report = BomReport()
+
+    part_nos = pd.Series(part_nos, dtype=object).astype(str).str.strip().reset_index(drop=True)
+    next_parts = pd.Series(next_parts, dtype=object).astype(str).str.strip().reset_index(drop=True)
+    report.total_rows = len(part_nos)
+
+    valid = ~_empty_mask(part_nos)
+    report.empty_rows = int((~valid).sum())
+    parts = part_nos[valid].reset_index(drop=True)
+    parents = next_parts[valid].reset_index(drop=True)
+    is_root = _empty_mask(parents)
+
+    # 최종 루트
+    report.roots = parts[is_root].drop_duplicates().tolist()
+
+    # 중복 (파트, 부모) 행
+    pairs = pd.DataFrame({"part": parts, "parent": parents.where(~is_root, "")})
+    counts = pairs.groupby(["part", "parent"], sort=False).size()
+    counts = counts[counts > 1]
+    report.duplicates = [(p, n, int(c)) for (p, n), c in counts.items()]
+
+    # 존재하지 않는 부모
+    known = pd.Index(parts.unique())
+    dangling = ~is_root & ~parents.isin(known)
+    if dangling.any():
+        grouped = parts[dangling].groupby(parents[dangling], sort=True)
+        report.dangling_parents = {parent: group.tolist() for parent, group in grouped}
+
+    # 그래프 구성: 노드 코드화 후 자식 -> 부모 간선
+    n = len(known)
+    edge_rows = (~is_root & ~dangling).to_numpy()
+    child_code = known.get_indexer(parts[edge_rows])
+    parent_code = known.get_indexer(parents[edge_rows])
+
+    # 루트에서 도달 가능한 노드 (프런티어를 깊이 단위로 확장)
+    reached = np.zeros(n, dtype=bool)
+    reached[known.get_indexer(report.roots)] = True
+    while True:
+        newly = reached[parent_code] & ~reached[child_code]
+        if not newly.any():
+            break
+        reached[child_code[newly]] = True
+    report.orphans = known[~reached].tolist()
+
+    # 순환 참조: 양방향으로 말단을 제거한 뒤, 남은 노드 중 순환 위에 있는 노드만
+    # (두 순환을 잇는 경로 위의 노드도 남으므로 강한 연결 요소로 다시 거름)
+    alive = np.ones(n, dtype=bool)
+    alive = _peel(alive, parent_code, child_code, n)   # 자식이 없는 노드 제거
+    alive = _peel(alive, child_code, parent_code, n)   # 부모가 없는 노드 제거
+    on_cycle = np.zeros(n, dtype=bool)
+    if alive.any():
+        labels = _strong_components(alive, child_code, parent_code, n)
+        sizes = np.bincount(labels[alive], minlength=n)
+        on_cycle = alive & (sizes[np.maximum(labels, 0)] > 1)
+        on_cycle[child_code[child_code == parent_code]] = True   # 자기 자신이 부모인 파트
+    report.cycles = known[on_cycle].tolist()
+
+    # BOM에 없는 자산
+    if asset_parts:
+        bom_upper = pd.Index(parts.str.upper().unique())
+        for kind, asset_part_numbers in asset_parts.items():
+            assets = pd.Index(list(asset_part_numbers), dtype=object)
+            report.unknown_assets[kind] = assets.difference(bom_upper).tolist()
+
+    report.elapsed = time.time() - start_time
+    return report
@@ -0,0 +1,146 @@
+# fuzzy_index.py
+import re
+import numpy as np
+
+# ─────────────────────────────────────────────────────────────
+# 파일명 → 파트넘버 퍼지 매칭 (문자 n-gram 역색인)
+# aaa_bbb_ccc_PARTNO 규칙을 따르지 않는 협력사 파일명을 BOM 파트에 연결할 때 사용
+# ─────────────────────────────────────────────────────────────
+DEFAULT_THRESHOLD = 0.85   # 자동 연결 최소 신뢰도
+DEFAULT_MARGIN = 0.05      # 1위와 2위 후보의 최소 점수 차 (애매하면 연결하지 않음)
+UNBOUNDED_PENALTY = 0.75   # 파일명 안에서 구분자 경계로 둘러싸이지 않은 후보의 점수 배율
+RERANK_FACTOR = 4          # 경계 검사로 재정렬할 후보 수 = limit * RERANK_FACTOR
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]")
+_ALNUM = re.compile(r"[0-9A-Z]")
+
+
+def normalize(text):
+    """대문자로 바꾸고 영숫자 외 문자(구분자, 공백 등) 제거"""
+    return _NON_ALNUM.sub("", str(text).upper())
+
+
+def normalize_with_positions(text):
+    """normalize 결과와, 각 문자의 원래 문자열 내 위치 리스트"""
+    matches = list(_ALNUM.finditer(str(text).upper()))
+    return "".join(m.group() for m in matches), [m.start() for m in matches]
+
+
+def is_bounded_match(key, query_key, positions):
+    """
+    정규화된 파트넘버 key가 query_key 안에 있고, 원래 파일명에서 앞뒤가
+    문자열 끝이나 구분자(공백, _, - 등)로 끊겨 있는지 여부.
+    예: '85N0056-0050' 안의 '85N0056-005'는 뒤에 '0'이 붙어 있으므로 False
+    """
+    start = query_key.find(key)
+    while start != -1:
+        end = start + len(key)
+        left_ok = start == 0 or positions[start] - positions[start - 1] > 1
+        right_ok = end == len(query_key) or positions[end] - positions[end - 1] > 1
+        if left_ok and right_ok:
+            return True
+        start = query_key.find(key, start + 1)
+    return False
+
+
+def ngrams(text, n):
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class NGramIndex:
+    """
+    BOM 파트넘버 전체에 대한 n-gram 역색인.
+    질의 시 n-gram별 포스팅 배열을 이어 붙여 np.bincount 한 번으로
+    모든 파트의 공통 n-gram 수를 구하므로, 파일 하나당 1ms 미만으로 처리됨.
+
+    신뢰도 = 0.8 * (파트 n-gram 중 파일명에 포함된 비율) + 0.2 * Dice 계수
+    파트넘버가 파일명 안에 구분자 경계로 온전히 들어 있지 않으면 UNBOUNDED_PENALTY를 곱함
+    (BOM에 없는 '85N0056-0050'이 더 짧은 '85N0056-005'에 연결되는 것을 방지).
+    """
+
+    def __init__(self, part_numbers, n=3):
+        self.n = n
+        self.parts = []          # 파트 id -> 원본 파트넘버 (BOM 표기 그대로)
+        self._exact = {}         # 정규화된 파트넘버 -> 원본 파트넘버 리스트 (구분자만 다른 파트는 여러 개)
+        self._keys = []          # 파트 id -> 정규화된 파트넘버
+        postings = {}            # n-gram -> 파트 id 리스트
+        gram_counts = []
+
+        for part_number in part_numbers:
+            part_number = str(part_number).strip()
+            key = normalize(part_number)
+            if not key or part_number in self._exact.get(key, ()):
+                continue
+            self._exact.setdefault(key, []).append(part_number)
+            part_id = len(self.parts)
+            self.parts.append(part_number)
+            self._keys.append(key)
+            grams = ngrams(key, n)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                postings.setdefault(gram, []).append(part_id)
+
+        self._gram_counts = np.array(gram_counts, dtype=np.float64)
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def __len__(self):
+        return len(self.parts)
+
+    def __contains__(self, part_number):
+        """정규화 기준으로 BOM에 있는 파트넘버인지 여부"""
+        return normalize(part_number) in self._exact
+
+    def query(self, text, limit=5):
+        """파일명(확장자 제외)에 대한 후보 파트 목록 [(파트넘버, 신뢰도), ...] (신뢰도 내림차순)"""
+        key, positions = normalize_with_positions(text)
+        if not key:
+            return []
+        if key in self._exact:
+            return [(part_number, 1.0) for part_number in self._exact[key][:limit]]
+
+        grams = ngrams(key, self.n)
+        hit_lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not hit_lists:
+            return []
+
+        common = np.bincount(np.concatenate(hit_lists), minlength=len(self.parts))
+        candidates = np.flatnonzero(common)
+        hits = common[candidates]
+        part_grams = self._gram_counts[candidates]
+        containment = hits / part_grams
+        dice = 2.0 * hits / (len(grams) + part_grams)
+        scores = 0.8 * containment + 0.2 * dice
+
+        # 상위 후보만 경계 검사 후 재정렬
+        pool = limit * RERANK_FACTOR
+        if len(candidates) > pool:
+            top = np.argpartition(-scores, pool - 1)[:pool]
+        else:
+            top = np.arange(len(candidates))
+        ranked = []
+        for i in top:
+            part_id = candidates[i]
+            score = float(scores[i])
+            if not is_bounded_match(self._keys[part_id], key, positions):
+                score *= UNBOUNDED_PENALTY
+            ranked.append((self.parts[part_id], score))
+        ranked.sort(key=lambda match: match[1], reverse=True)
+        return ranked[:limit]
+
+    def resolve(self, text, threshold=DEFAULT_THRESHOLD, margin=DEFAULT_MARGIN):
+        """
+        신뢰도가 threshold 이상이고 2위와 margin 이상 차이 나는 경우에만 파트넘버 반환.
+        정규화하면 같아지는 파트가 여러 개인 경우(예: 85N0056-005 / 85N00560-05)를 포함해
+        그 외에는 None (자동 연결하지 않음).
+        """
+        matches = self.query(text, limit=2)
+        if not matches:
+            return None
+        part_number, score = matches[0]
+        if len(self._exact[normalize(part_number)]) > 1:
+            return None
+        if score < threshold:
+            return None
+        if len(matches) > 1 and score - matches[1][1] < margin:
+            return None
+        return part_number
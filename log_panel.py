@@ -0,0 +1,87 @@
+# log_panel.py
+import datetime
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# ─────────────────────────────────────────────────────────────
+# 로그 심각도 레벨
+# ─────────────────────────────────────────────────────────────
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+
+class LogModel(QObject):
+    """
+    일괄 출력 로그 모델. 화면 쪽 링 버퍼는 capacity 블록으로 제한된 로그 위젯이 담당.
+    append()는 버퍼에 쌓기만 하고, 타이머가 flush_interval(ms)마다
+    모아 둔 메시지를 한 번에 batchReady 시그널로 내보냄.
+    타이머가 돌 수 없는 동기 작업 중에도 대기 메시지가 capacity개에 이르면 바로 flush하므로
+    파일 싱크에는 모든 레벨의 메시지가 빠짐없이 기록됨 (링 버퍼 제한은 화면 버퍼에만 적용).
+    """
+    batchReady = pyqtSignal(str)  # 화면에 추가할 텍스트 (여러 줄을 하나로 합친 것)
+
+    def __init__(self, capacity=2000, flush_interval=100, min_level="INFO", parent=None):
+        super().__init__(parent)
+        self.capacity = capacity
+        self.min_level = LOG_LEVELS[min_level]
+        self._pending = []                      # 아직 flush되지 않은 레코드 (capacity개에서 flush)
+        self._sink = None
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(flush_interval)
+        self._timer.timeout.connect(self.flush)
+
+    def append(self, message, level="INFO"):
+        if level not in LOG_LEVELS:
+            level = "INFO"
+        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        record = (timestamp, level, str(message))  # (시간, 레벨, 메시지)
+        self._pending.append(record)
+        if len(self._pending) >= self.capacity:
+            self.flush()
+        elif not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """대기 중인 메시지를 한 번에 내보냄"""
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        self._timer.stop()
+
+        if self._sink is not None:
+            try:
+                self._sink.write("".join(
+                    f"{ts} [{level}] {message}\n" for ts, level, message in pending
+                ))
+                self._sink.flush()
+            except OSError:
+                self._sink = None
+
+        lines = [
+            self.format_record(record) for record in pending
+            if LOG_LEVELS[record[1]] >= self.min_level
+        ]
+        if lines:
+            self.batchReady.emit("\n".join(lines))
+
+    def set_file_sink(self, file_path):
+        """로그 파일 싱크 설정 (None이면 해제). 파일은 append 모드로 열림"""
+        self.close_file_sink()
+        if file_path:
+            self._sink = open(file_path, "a", encoding="utf-8")
+
+    def close_file_sink(self):
+        if self._sink is not None:
+            try:
+                self._sink.close()
+            except OSError:
+                pass
+            self._sink = None
+
+    @staticmethod
+    def format_record(record):
+        timestamp, level, message = record
+        if level == "INFO":
+            return f"[{timestamp}] {message}"
+        return f"[{timestamp}] [{level}] {message}"
@@ -1,27 +1,41 @@
 import os
 import sys
+import argparse
 from PyQt5.QtWidgets import QApplication
 from ui_functionality import MainWindow
-from tree_manager import get_base_path, build_tree_view
+from tree_manager import get_base_path
+from workspace import Workspace
 
 def main():
-    app = QApplication(sys.argv)
+    # --log-file 경로를 주면 로그를 파일에도 기록 (나머지 인자는 Qt로 전달)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--log-file", help="로그를 추가로 기록할 파일 경로")
+    args, qt_args = parser.parse_known_args()
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = MainWindow()
+    if args.log_file:
+        window.log_model.set_file_sink(args.log_file)
 
     base_path = get_base_path()
     excelfolder_path = os.path.join(base_path, "01_excel")
     excel_file_path = os.path.join(excelfolder_path, "data.xlsx")
-    
-    # JSON 파일 경로를 01_excel 폴더 내부로 지정
-    json_file_path = os.path.join(excelfolder_path, "memo.json")
     if not os.path.exists(excelfolder_path):
         os.makedirs(excelfolder_path)
     
-    window.json_file_path = json_file_path
-    window.load_memo_data()
+    # 01_excel 폴더의 모든 워크북을 워크스페이스에 등록 (data.xlsx를 기본으로 로드)
+    window.workspace = Workspace(window)
+    default_name = None
+    for fname in sorted(os.listdir(excelfolder_path)):
+        if fname.lower().endswith(".xlsx") and not fname.startswith("~$"):
+            name = window.workspace.add_program(os.path.join(excelfolder_path, fname))
+            if default_name is None or os.path.join(excelfolder_path, fname) == excel_file_path:
+                default_name = name
     
-    if os.path.exists(excel_file_path):
-        build_tree_view(excel_file_path, window)
+    if default_name is not None:
+        window.switch_program(default_name)
+    else:
+        window.refresh_program_list()
     
     window.show()
     sys.exit(app.exec_())
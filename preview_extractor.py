@@ -0,0 +1,189 @@
+# preview_extractor.py
+import os
+import queue
+import threading
+import zipfile
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from PyQt5.QtGui import QImage
+
+# ─────────────────────────────────────────────────────────────
+# 3DXML 미리보기 추출 설정
+# ─────────────────────────────────────────────────────────────
+PREVIEW_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+PREVIEW_KEYWORDS = ("preview", "thumbnail")
+THUMBNAIL_SIZE = 400  # imageLabel 크기와 동일
+
+
+def find_preview_member(zf):
+    """
+    ZIP 중앙 디렉터리(infolist)만 조회하여 미리보기 이미지 멤버를 찾음.
+    이름에 preview/thumbnail 이 들어간 이미지를 우선하고,
+    없으면 아카이브 최상위의 첫 번째 이미지를 사용.
+    """
+    fallback = None
+    for info in zf.infolist():
+        name = info.filename.lower()
+        if info.is_dir() or not name.endswith(PREVIEW_EXTENSIONS):
+            continue
+        base_name = os.path.basename(name)
+        if any(keyword in base_name for keyword in PREVIEW_KEYWORDS):
+            return info
+        if fallback is None and "/" not in name:
+            fallback = info
+    return fallback
+
+
+def thumbnail_path_for(cache_dir, xml_path, mtime_ns):
+    """캐시 썸네일 경로: <파일명>_<mtime_ns>.png (파일이 바뀌면 키도 바뀜)"""
+    stem = os.path.splitext(os.path.basename(xml_path))[0]
+    return os.path.join(cache_dir, f"{stem}_{mtime_ns}.png")
+
+
+def remove_stale_thumbnails(cache_dir, current_thumbnails):
+    """
+    캐시 폴더를 한 번만 훑어, current_thumbnails(3DXML 경로 -> 현재 썸네일 경로)에
+    있는 파일의 이전 mtime 썸네일을 삭제.
+    """
+    current_paths = set(current_thumbnails.values())
+    stems = {os.path.splitext(os.path.basename(p))[0] for p in current_thumbnails}
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for fname in names:
+        stem, sep, suffix = fname[:-len(".png")].rpartition("_")
+        if not (fname.endswith(".png") and sep and suffix.isdigit() and stem in stems):
+            continue
+        path = os.path.join(cache_dir, fname)
+        if path not in current_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def extract_preview(xml_path, cache_dir, size=THUMBNAIL_SIZE):
+    """
+    .3dxml(ZIP) 파일에서 미리보기 멤버 하나만 읽어 썸네일로 캐시.
+    캐시가 이미 있으면 아카이브를 열지 않음.
+    성공 시 썸네일 경로, 미리보기가 없거나 실패하면 None 반환.
+    """
+    try:
+        mtime_ns = os.stat(xml_path).st_mtime_ns
+    except OSError:
+        return None
+
+    thumb_path = thumbnail_path_for(cache_dir, xml_path, mtime_ns)
+    if os.path.exists(thumb_path):
+        return thumb_path
+
+    try:
+        with zipfile.ZipFile(xml_path) as zf:
+            info = find_preview_member(zf)
+            if info is None:
+                return None
+            data = zf.read(info)
+    except (zipfile.BadZipFile, OSError, KeyError, RuntimeError):
+        return None
+
+    # QImage는 GUI 스레드가 아니어도 사용 가능 (QPixmap은 불가)
+    image = QImage()
+    if not image.loadFromData(data):
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = thumb_path + ".tmp"
+    if not image.save(tmp_path, "PNG"):
+        return None
+    os.replace(tmp_path, thumb_path)
+    return thumb_path
+
+
+class PreviewExtractor(QObject):
+    """
+    02_3dxml 파일들의 미리보기를 백그라운드 워커 풀에서 추출하는 클래스.
+    작업 큐는 크기가 제한되어 있고, 큐가 가득 차면 GUI 스레드가 아닌
+    피더 스레드만 대기함. 새 enqueue 요청이 오면 이전 요청의 남은 작업은 버림.
+    요청한 작업이 모두 끝나면 이전 mtime의 썸네일을 한 번에 정리함.
+    """
+    previewReady = pyqtSignal(str, str)  # (3DXML 경로, 썸네일 경로)
+
+    def __init__(self, cache_dir, workers=2, queue_size=64, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker_count = workers
+        self._workers = []
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._previews = {}  # 3DXML 경로 -> 썸네일 경로
+
+    def enqueue(self, xml_paths):
+        """3DXML 경로 목록을 추출 대기열에 넣음 (이전 요청은 취소)"""
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+        self._ensure_workers()
+        feeder = threading.Thread(
+            target=self._feed, args=(generation, list(xml_paths)), daemon=True
+        )
+        feeder.start()
+
+    def preview_for(self, xml_path):
+        """추출된 썸네일 경로 반환. 아직 없으면 디스크 캐시를 확인하고, 그래도 없으면 None"""
+        with self._lock:
+            thumb_path = self._previews.get(xml_path)
+        if thumb_path and os.path.exists(thumb_path):
+            return thumb_path
+        try:
+            mtime_ns = os.stat(xml_path).st_mtime_ns
+        except OSError:
+            return None
+        thumb_path = thumbnail_path_for(self.cache_dir, xml_path, mtime_ns)
+        if os.path.exists(thumb_path):
+            with self._lock:
+                self._previews[xml_path] = thumb_path
+            return thumb_path
+        return None
+
+    def _ensure_workers(self):
+        while len(self._workers) < self._worker_count:
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _is_current(self, generation):
+        with self._lock:
+            return generation == self._generation
+
+    def _feed(self, generation, xml_paths):
+        for xml_path in xml_paths:
+            if not self._is_current(generation):
+                return
+            self._queue.put((generation, xml_path))
+        # 큐가 비면 오래된 썸네일을 한 번에 정리 (추출마다 폴더를 훑지 않도록)
+        self._queue.join()
+        if not self._is_current(generation):
+            return
+        with self._lock:
+            current = {p: self._previews[p] for p in xml_paths if p in self._previews}
+        remove_stale_thumbnails(self.cache_dir, current)
+
+    def _work(self):
+        while True:
+            generation, xml_path = self._queue.get()
+            try:
+                if not self._is_current(generation):
+                    continue
+                thumb_path = extract_preview(xml_path, self.cache_dir)
+                if thumb_path:
+                    with self._lock:
+                        self._previews[xml_path] = thumb_path
+                    # 워커 스레드에서 emit → 메인 스레드 슬롯으로 큐잉되어 전달됨
+                    self.previewReady.emit(xml_path, thumb_path)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
@@ -6,6 +6,10 @@ from PyQt5.QtWidgets import QTreeWidgetItem, QMessageBox, QHeaderView
 from PyQt5.QtGui import QPixmap, QBrush, QColor
 from PyQt5.QtCore import Qt, QUrl
 from PyQt5.QtGui import QDesktopServices
+from asset_index import AssetIndex
+from bom_validator import validate_bom
+from fuzzy_index import NGramIndex
+from tree_scheduler import iter_tree_items
 
 # ─────────────────────────────────────────────────────────────
 # 전역 변수들
@@ -13,11 +17,15 @@ from PyQt5.QtGui import QDesktopServices
 nodeCount = 0
 g_NodeDictionary = {}  # 파트넘버 -> 트리 아이템
 
+# 파트넘버별 모든 자산 파일을 보관하는 인덱스 (리비전/mtime 순 정렬)
+asset_index = AssetIndex()
+
 # 파일 관련 딕셔너리를 중첩 구조로 관리
+# (asset_index 위의 읽기 전용 뷰: 파트넘버 -> 현재 선택된 파일 경로)
 files_dict = {
-    "image": {},   # 파트넘버 -> 이미지 파일 경로
-    "xml3d": {},   # 파트넘버 -> 3DXML 파일 경로
-    "fbx": {}      # 파트넘버 -> FBX 파일 경로
+    "image": asset_index.view("image"),   # 파트넘버 -> 이미지 파일 경로
+    "xml3d": asset_index.view("xml3d"),   # 파트넘버 -> 3DXML 파일 경로
+    "fbx": asset_index.view("fbx")        # 파트넘버 -> FBX 파일 경로
 }
 
 def get_base_path():
@@ -26,74 +34,64 @@ def get_base_path():
         return os.path.dirname(sys.executable)
     return os.path.dirname(__file__)
 
-def build_xml3d_dict(window):
+def scan_asset_folder(kind, folder_name, extensions, window, caller):
     """
-    02_3dxml 폴더에서 .3dxml 파일을 스캔하여,
-    파일명 예: aaa_bbb_ccc_PARTNO.3dxml 의 형식이라고 가정하고,
-    PARTNO를 추출하여 files_dict["xml3d"][PARTNO] = 파일 경로 로 저장.
+    base_path/folder_name 폴더를 스캔하여 asset_index의 kind 테이블을 다시 구성.
+    파트넘버 하나에 여러 파일(리비전, 뷰)이 있으면 모두 보관함.
+    window.part_matcher가 있으면 명명 규칙 밖 파일은 퍼지 매칭으로 연결.
+    활성 BOM에서 찾지 못하면 window.other_part_matchers(로드된 다른 워크북)에서 찾음.
+    규칙대로 파싱했더라도 어느 BOM에도 없는 파트넘버면 퍼지 매칭을 시도함.
     """
-    files_dict["xml3d"].clear()  # 기존 데이터 초기화
-    base_path = get_base_path()  
-    folder_path = os.path.join(base_path, "02_3dxml")
+    asset_index.clear(kind)
+    folder_path = os.path.join(get_base_path(), folder_name)
     
     if not os.path.exists(folder_path):
-        window.appendLog(f"[build_xml3d_dict] 02_3dxml 폴더를 찾을 수 없습니다: {folder_path}")
+        window.appendLog(f"[{caller}] {folder_name} 폴더를 찾을 수 없습니다: {folder_path}", "WARNING")
         return
     
-    for fname in os.listdir(folder_path):
-        lower_name = fname.lower()
-        if lower_name.endswith(".3dxml"):
-            file_parts = fname.split("_")
-            if len(file_parts) >= 4:
-                part_number = os.path.splitext(file_parts[3])[0].upper()
-                if part_number not in files_dict["xml3d"]:
-                    files_dict["xml3d"][part_number] = os.path.join(folder_path, fname)
+    matchers = [getattr(window, "part_matcher", None)] + list(getattr(window, "other_part_matchers", []))
+    matchers = [matcher for matcher in matchers if matcher is not None]
+    
+    def resolver(name):
+        for matcher in matchers:
+            part_no = matcher.resolve(name)
+            if part_no is not None:
+                return part_no
+        return None
+    
+    def is_known(part_no):
+        return any(part_no in matcher for matcher in matchers)
+    
+    if matchers:
+        asset_index.scan_folder(kind, folder_path, extensions, resolver, is_known)
+    else:
+        asset_index.scan_folder(kind, folder_path, extensions)
+    if asset_index.fuzzy_count(kind):
+        window.appendLog(f"[{caller}] 명명 규칙 밖 파일 {asset_index.fuzzy_count(kind)}개를 퍼지 매칭으로 연결했습니다.")
+
+def build_xml3d_dict(window):
+    """
+    02_3dxml 폴더에서 .3dxml 파일을 스캔하여,
+    파일명 예: aaa_bbb_ccc_PARTNO[_REV].3dxml 의 형식이라고 가정하고,
+    PARTNO별 모든 파일을 asset_index의 "xml3d" 테이블에 저장.
+    """
+    scan_asset_folder("xml3d", "02_3dxml", (".3dxml",), window, "build_xml3d_dict")
 
 def build_image_dict(window):
     """
     00_image 폴더에서 PNG/JPG 파일을 스캔하여,
-    파일명 예: aaa_bbb_ccc_PARTNO.png 의 형식이라고 가정하고,
-    PARTNO를 추출하여 files_dict["image"][PARTNO] = 파일 경로 로 저장.
+    파일명 예: aaa_bbb_ccc_PARTNO[_REV].png 의 형식이라고 가정하고,
+    PARTNO별 모든 파일을 asset_index의 "image" 테이블에 저장.
     """
-    files_dict["image"].clear()
-    base_path = get_base_path()
-    folder_path = os.path.join(base_path, "00_image")
-    
-    if not os.path.exists(folder_path):
-        window.appendLog(f"[build_image_dict] 00_image 폴더를 찾을 수 없습니다: {folder_path}")
-        return
-    
-    for fname in os.listdir(folder_path):
-        lower_name = fname.lower()
-        if lower_name.endswith(".png") or lower_name.endswith(".jpg"):
-            file_parts = fname.split("_")
-            if len(file_parts) >= 4:
-                part_number = os.path.splitext(file_parts[3])[0].upper()
-                if part_number not in files_dict["image"]:
-                    files_dict["image"][part_number] = os.path.join(folder_path, fname)
+    scan_asset_folder("image", "00_image", (".png", ".jpg"), window, "build_image_dict")
 
 def build_fbx_dict(window):
     """
     03_fbx 폴더에서 .fbx 파일을 스캔하여,
-    파일명 예: aaa_bbb_ccc_PARTNO.fbx 의 형식이라고 가정하고,
-    PARTNO를 추출하여 files_dict["fbx"][PARTNO] = 파일 경로 로 저장.
+    파일명 예: aaa_bbb_ccc_PARTNO[_REV].fbx 의 형식이라고 가정하고,
+    PARTNO별 모든 파일을 asset_index의 "fbx" 테이블에 저장.
     """
-    files_dict["fbx"].clear()
-    base_path = get_base_path()
-    folder_path = os.path.join(base_path, "03_fbx")
-    
-    if not os.path.exists(folder_path):
-        window.appendLog(f"[build_fbx_dict] 03_fbx 폴더를 찾을 수 없습니다: {folder_path}")
-        return
-    
-    for fname in os.listdir(folder_path):
-        lower_name = fname.lower()
-        if lower_name.endswith(".fbx"):
-            file_parts = fname.split("_")
-            if len(file_parts) >= 4:
-                part_number = os.path.splitext(file_parts[3])[0].upper()
-                if part_number not in files_dict["fbx"]:
-                    files_dict["fbx"][part_number] = os.path.join(folder_path, fname)
+    scan_asset_folder("fbx", "03_fbx", (".fbx",), window, "build_fbx_dict")
 
 def safe_int(value, default="nan"):
     """
@@ -109,7 +107,7 @@ def safe_int(value, default="nan"):
 
 def display_part_info(part_no, window):
     """
-    엑셀의 메타데이터를 로그창(window.logText)에 출력
+    엑셀의 메타데이터를 파트 정보 뷰(window.partInfoLabel)에 출력
     """
     try:
         df = window.df
@@ -122,7 +120,8 @@ def display_part_info(part_no, window):
         
         row = df[df["Part No"].str.strip() == part_no]
         if row.empty:
-            window.appendLog(f"해당하는 '{part_no}' 값을 찾을 수 없습니다.")
+            window.partInfoLabel.clear()
+            window.appendLog(f"해당하는 '{part_no}' 값을 찾을 수 없습니다.", "WARNING")
             return
         
         row = row.iloc[0]
@@ -142,10 +141,9 @@ def display_part_info(part_no, window):
         # 줄바꿈(\n)을 <br>로 변환
         formatted_metadata = metadataStr.replace('\n', '<br>')
         formatted_html = f"<b>{formatted_metadata}</b>"
-        window.logText.clear()
-        window.logText.setHtml(formatted_html)
+        window.partInfoLabel.setText(formatted_html)
     except Exception as e:
-        window.appendLog("에러 발생: " + str(e))
+        window.appendLog("에러 발생: " + str(e), "ERROR")
 
 def add_nodes_original(tree_widget, parent_item, dict_rel, node_keys):
     """
@@ -175,10 +173,11 @@ def add_nodes_original(tree_widget, parent_item, dict_rel, node_keys):
         if not is_duplicate:
             add_nodes_original(tree_widget, child_item, dict_rel, node_keys)
 
-def apply_tree_view_styles(tree_widget, style):
-    # 업데이트 중지 (렌더링 최적화)
-    tree_widget.setUpdatesEnabled(False)
-    
+def iter_tree_view_styles(tree_widget, style):
+    """
+    모드별 파일 유무에 따라 노드 스타일을 적용하는 제너레이터 (노드 하나당 yield 한 번).
+    ChunkedTreeScheduler로 시간 분할 실행하거나 apply_tree_view_styles로 한 번에 실행.
+    """
     # 기본 QBrush와 조건별 QBrush, 파일 딕셔너리를 미리 설정
     default_brush = QBrush(QColor(0, 0, 0))
     if style == "image":
@@ -194,28 +193,23 @@ def apply_tree_view_styles(tree_widget, style):
         active_brush = default_brush
         file_dict = {}
 
-    def recurse(item):
-        part_no = item.text(0)
+    for item, _ in iter_tree_items(tree_widget):
         # 미리 upper() 결과를 저장 (반복 호출 줄임)
-        part_no_upper = part_no.upper()
+        part_no_upper = item.text(0).upper()
         font = item.font(0)
-        # 기본 스타일: 볼드 해제, 기본 색상 설정
-        font.setBold(False)
+        # 파일 딕셔너리에 해당 파트가 있으면 볼드 + 모드 색상, 없으면 기본 스타일
+        has_file = part_no_upper in file_dict
+        font.setBold(has_file)
         item.setFont(0, font)
-        item.setForeground(0, default_brush)
-        
-        # 파일 딕셔너리에 해당 파트가 있으면 스타일 적용
-        if part_no_upper in file_dict:
-            font.setBold(True)
-            item.setFont(0, font)
-            item.setForeground(0, active_brush)
-        
-        for i in range(item.childCount()):
-            recurse(item.child(i))
-    
-    for i in range(tree_widget.topLevelItemCount()):
-        recurse(tree_widget.topLevelItem(i))
-    
+        item.setForeground(0, active_brush if has_file else default_brush)
+        yield
+
+def apply_tree_view_styles(tree_widget, style):
+    """노드 스타일을 한 번에 적용 (시간 분할 실행은 iter_tree_view_styles 사용)"""
+    # 업데이트 중지 (렌더링 최적화)
+    tree_widget.setUpdatesEnabled(False)
+    for _ in iter_tree_view_styles(tree_widget, style):
+        pass
     tree_widget.repaint()
     # 업데이트 다시 활성화
     tree_widget.setUpdatesEnabled(True)
@@ -228,11 +222,6 @@ def build_tree_view(excel_path, window):
     global nodeCount, g_NodeDictionary
     start_time = time.time()
     
-    # 이미지, 3DXML, FBX 파일 정보 딕셔너리 갱신
-    build_image_dict(window)
-    build_xml3d_dict(window)
-    build_fbx_dict(window)
-    
     df = pd.read_excel(excel_path, sheet_name="Sheet1")
     if "PartNo" in df.columns and "NextPart" in df.columns:
         part_nos = df["PartNo"].astype(str).str.strip()
@@ -241,8 +230,35 @@ def build_tree_view(excel_path, window):
         part_nos = df.iloc[:, 3].astype(str).str.strip()
         next_parts = df.iloc[:, 13].astype(str).str.strip()
     
+    # 파일명 퍼지 매칭용 n-gram 색인 (BOM 파트넘버 기준, 파일 스캔 전에 구성)
+    valid_part_nos = part_nos[(part_nos != "") & (part_nos.str.lower() != "nan")]
+    window.part_matcher = NGramIndex(valid_part_nos.unique())
+    
+    # 이미지, 3DXML, FBX 파일 정보 딕셔너리 갱신
+    build_image_dict(window)
+    build_xml3d_dict(window)
+    build_fbx_dict(window)
+    
+    # 3DXML 미리보기 썸네일은 백그라운드에서 추출 (cycle로 바꿀 수 있는 대체 후보 포함)
+    if hasattr(window, "preview_extractor"):
+        window.preview_extractor.enqueue(asset_index.paths("xml3d"))
+    
     window.df = df  # 엑셀 데이터를 MainWindow에 저장
     
+    # BOM 무결성 검사 (벡터 연산, 매 로드마다 실행)
+    # 공유 자산 인덱스에는 다른 워크북의 파일도 있으므로, 로드된 다른 BOM에 있는 파트는 제외
+    other_matchers = getattr(window, "other_part_matchers", [])
+    asset_parts = {
+        kind: [
+            part for part in files_dict[kind].keys()
+            if not any(part in matcher for matcher in other_matchers)
+        ]
+        for kind in files_dict
+    }
+    report = validate_bom(part_nos, next_parts, asset_parts)
+    window.bom_report = report
+    window.appendLog("\n".join(report.summary_lines()), "WARNING" if report.has_issues() else "INFO")
+    
     total_parts = 0
     nodeCount = 0
     dict_rel = {}
@@ -262,10 +278,13 @@ def build_tree_view(excel_path, window):
                 dict_rel[next_part].append(part_no)
     
     if len(final_roots) == 0:
-        window.appendLog("[build_tree_view] 최종 루트(final root)가 없습니다.")
+        window.appendLog("[build_tree_view] 최종 루트(final root)가 없습니다.", "ERROR")
         return
     root_key = list(final_roots)[0]
     
+    # 진행 중인 시간 분할 작업은 지워질 노드를 참조하므로 먼저 취소
+    if hasattr(window, "tree_scheduler"):
+        window.tree_scheduler.cancel_all()
     window.tree.clear()
     
     # 헤더 마지막 컬럼 자동 확장 해제
@@ -286,14 +305,17 @@ def build_tree_view(excel_path, window):
     root_item.setExpanded(True)
     
     add_nodes_original(window.tree, root_item, dict_rel, node_keys)
-    # 기본 스타일 적용 (초기에는 image 스타일 적용)
-    apply_tree_view_styles(window.tree, "image")
+    # 기본 스타일 적용 (초기에는 image 스타일 적용, 가능하면 시간 분할 실행)
+    if hasattr(window, "schedule_tree_styles"):
+        window.schedule_tree_styles("image")
+    else:
+        apply_tree_view_styles(window.tree, "image")
     
     # 최종 요약정보 작성
     summary_log = "===== Operation Summary =====\n"
-    summary_log += f"총 이미지 파일 수: {len(files_dict['image'])}\n"
-    summary_log += f"총 3DXML 파일 수: {len(files_dict['xml3d'])}\n"
-    summary_log += f"총 FBX 파일 수: {len(files_dict['fbx'])}\n"
+    summary_log += f"총 이미지 파일 수: {asset_index.file_count('image')} (파트 {len(files_dict['image'])})\n"
+    summary_log += f"총 3DXML 파일 수: {asset_index.file_count('xml3d')} (파트 {len(files_dict['xml3d'])})\n"
+    summary_log += f"총 FBX 파일 수: {asset_index.file_count('fbx')} (파트 {len(files_dict['fbx'])})\n"
     summary_log += f"총 유효 파트 수: {total_parts}\n"
     summary_log += f"트리뷰에 추가된 전체 노드 수: {nodeCount}\n"
     window.appendLog(summary_log)
@@ -0,0 +1,148 @@
+# tree_scheduler.py
+import time
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QTimer
+
+
+class ChunkedTreeScheduler(QObject):
+    """
+    트리 전체 순회 작업을 시간 분할(time slice)로 실행하는 협력형 스케줄러.
+    작업은 제너레이터이며, yield 한 번이 작업 단위 하나(보통 노드 하나).
+    QTimer(0ms)가 한 번 호출될 때마다 budget_ms 동안만 실행하고 이벤트 루프에
+    제어를 돌려주므로 큰 BOM에서도 UI가 멈추지 않음.
+    같은 key로 새 작업을 submit하면 이전 작업은 취소됨.
+    """
+
+    def __init__(self, widget=None, budget_ms=8, parent=None):
+        super().__init__(parent)
+        self.widget = widget               # 슬라이스마다 업데이트를 중지할 위젯 (트리)
+        self.budget = budget_ms / 1000.0
+        self._jobs = OrderedDict()         # key -> (제너레이터, 완료 콜백)
+        self._timer = QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._run_slice)
+
+    def submit(self, key, job, on_done=None):
+        """작업 등록 (같은 key의 진행 중인 작업은 취소 후 교체)"""
+        self.cancel(key)
+        self._jobs[key] = (job, on_done)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def cancel(self, key):
+        entry = self._jobs.pop(key, None)
+        if entry is not None:
+            entry[0].close()
+
+    def cancel_all(self):
+        for key in list(self._jobs):
+            self.cancel(key)
+        self._timer.stop()
+
+    def run_now(self, key):
+        """등록된 작업을 남은 부분까지 즉시 끝까지 실행"""
+        entry = self._jobs.pop(key, None)
+        if entry is None:
+            return
+        job, on_done = entry
+        for _ in job:
+            pass
+        if on_done:
+            on_done()
+
+    def _run_slice(self):
+        deadline = time.perf_counter() + self.budget
+        finished = []
+        if self.widget is not None:
+            self.widget.setUpdatesEnabled(False)
+        try:
+            # 등록 순서대로 실행 (먼저 등록된 작업이 먼저 끝남)
+            for key, (job, on_done) in list(self._jobs.items()):
+                try:
+                    while time.perf_counter() < deadline:
+                        next(job)
+                except StopIteration:
+                    del self._jobs[key]
+                    finished.append(on_done)
+                except Exception:
+                    # 순회 중 트리가 바뀌는 등 실패한 작업은 버림
+                    del self._jobs[key]
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            if self.widget is not None:
+                self.widget.setUpdatesEnabled(True)
+
+        if not self._jobs:
+            self._timer.stop()
+        for on_done in finished:
+            if on_done:
+                on_done()
+
+
+# ─────────────────────────────────────────────────────────────
+# 트리 순회 제너레이터 (스케줄러 작업 단위)
+# ─────────────────────────────────────────────────────────────
+def iter_tree_items(tree_widget):
+    """전위 순회로 (노드, 깊이) 를 하나씩 반환. 자식은 방문 시점에 조회"""
+    stack = [
+        (tree_widget.topLevelItem(i), 0)
+        for i in range(tree_widget.topLevelItemCount() - 1, -1, -1)
+    ]
+    while stack:
+        item, depth = stack.pop()
+        yield item, depth
+        for i in range(item.childCount() - 1, -1, -1):
+            stack.append((item.child(i), depth + 1))
+
+
+def iter_clear_filter(tree_widget):
+    """모든 노드 표시"""
+    for item, _ in iter_tree_items(tree_widget):
+        item.setHidden(False)
+        yield
+
+
+def iter_filter_items(tree_widget, file_dict):
+    """
+    후위 순회로 파일이 있는 노드와 그 조상만 표시.
+    스택 프레임: [노드, 다음 자식 위치, 보이는 자식 존재 여부]
+    """
+    for i in range(tree_widget.topLevelItemCount()):
+        stack = [[tree_widget.topLevelItem(i), 0, False]]
+        while stack:
+            frame = stack[-1]
+            item = frame[0]
+            if frame[1] < item.childCount():
+                frame[1] += 1
+                stack.append([item.child(frame[1] - 1), 0, False])
+                continue
+            stack.pop()
+            visible = frame[2] or item.text(0).upper() in file_dict
+            item.setHidden(not visible)
+            if visible and stack:
+                stack[-1][2] = True
+            yield
+
+
+def iter_expand_to_level(tree_widget, level=None):
+    """
+    깊이가 level 미만인 노드는 펼치고 나머지는 접음.
+    level이 None이면 전체 펼치기. 자식이 없는 노드는 방문하지 않음.
+    """
+    stack = [
+        (tree_widget.topLevelItem(i), 0)
+        for i in range(tree_widget.topLevelItemCount() - 1, -1, -1)
+    ]
+    while stack:
+        item, depth = stack.pop()
+        if item.childCount() == 0:
+            continue
+        expand = level is None or depth < level
+        if item.isExpanded() != expand:
+            item.setExpanded(expand)
+        yield
+        for i in range(item.childCount() - 1, -1, -1):
+            child = item.child(i)
+            if child.childCount():
+                stack.append((child, depth + 1))
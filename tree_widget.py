@@ -3,6 +3,7 @@ import os
 import sys
 from PyQt5.QtWidgets import QTreeWidget, QMessageBox
 from PyQt5.QtCore import pyqtSignal
+import tree_manager
 
 class MyTreeWidget(QTreeWidget):
     """
@@ -47,6 +48,15 @@ class MyTreeWidget(QTreeWidget):
                 part_number = parts[3] if len(parts) >= 4 else file_name_no_ext
                 item = self.find_item(part_number)
 
+                # 명명 규칙에 맞지 않는 파일명은 n-gram 퍼지 매칭으로 파트 검색
+                part_matcher = getattr(main_window, "part_matcher", None)
+                if item is None and part_matcher is not None:
+                    matched_part = part_matcher.resolve(file_name_no_ext)
+                    if matched_part:
+                        item = self.find_item(matched_part)
+                        if item and hasattr(main_window, "appendLog"):
+                            main_window.appendLog(f"[퍼지 매칭] {file_name_no_ext} → {matched_part}")
+
                 if item:
                     self.setCurrentItem(item)
                     item.setExpanded(True)
@@ -70,7 +80,12 @@ class MyTreeWidget(QTreeWidget):
     def find_item(self, text):
         """
         재귀적으로 트리 내에서 주어진 텍스트와 일치하는 노드를 검색
+        (g_NodeDictionary에 등록된 노드는 재귀 없이 바로 반환)
         """
+        item = tree_manager.g_NodeDictionary.get(text)
+        if item is not None and item.treeWidget() is self:
+            return item
+
         def recursive_search(item):
             if item.text(0) == text:
                 return item
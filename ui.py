@@ -1,7 +1,7 @@
 # ui.py
 from PyQt5.QtWidgets import (
-    QMainWindow, QTreeWidget, QTextEdit, QVBoxLayout, QHBoxLayout,
-    QWidget, QLabel, QRadioButton, QGroupBox, QPushButton, QSpacerItem, QSizePolicy, QCheckBox,
+    QMainWindow, QTreeWidget, QTextEdit, QPlainTextEdit, QVBoxLayout, QHBoxLayout,
+    QWidget, QLabel, QRadioButton, QGroupBox, QPushButton, QSpacerItem, QSizePolicy, QCheckBox, QSpinBox, QComboBox,
     )
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QFont, QFontMetrics
@@ -26,12 +26,34 @@ class MainWindowUI:
         self.tree.setColumnCount(1)
         self.tree.setHeaderLabels(["FA-50M FINAL ASSEMBLY VERSION POLAND"])
         
-        self.logText = QTextEdit(MainWindow)
+        # 파트 메타데이터 표시용 (로그 문서를 다시 쓰지 않도록 분리)
+        self.partInfoLabel = QLabel(MainWindow)
+        self.partInfoLabel.setTextFormat(Qt.RichText)
+        self.partInfoLabel.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.partInfoLabel.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.partInfoLabel.setWordWrap(True)
+        self.partInfoLabel.setStyleSheet("border: 1px solid gray; padding: 4px;")
+        self.partInfoLabel.setFixedHeight(230)
+        
+        # 로그창: 블록(줄) 수 제한으로 긴 세션에서도 문서 크기 고정
+        self.logText = QPlainTextEdit(MainWindow)
         self.logText.setReadOnly(True)
+        self.logText.setMaximumBlockCount(2000)
         self.logText.setFixedHeight(300)
         
+        # 프로그램(워크북) 선택 행
+        self.program_combo = QComboBox(MainWindow)
+        self.program_combo.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.open_program_button = QPushButton("Open...", MainWindow)
+        program_layout = QHBoxLayout()
+        program_layout.addWidget(QLabel("Program", MainWindow))
+        program_layout.addWidget(self.program_combo, 1)
+        program_layout.addWidget(self.open_program_button)
+        
         leftLayout = QVBoxLayout()
+        leftLayout.addLayout(program_layout)
         leftLayout.addWidget(self.tree, 3)
+        leftLayout.addWidget(self.partInfoLabel)
         leftLayout.addWidget(self.logText, 1)
         leftLayout.setSpacing(25)
         leftWidget = QWidget()
@@ -64,6 +86,11 @@ class MainWindowUI:
         self.filter_button.setMinimumSize(130, 40)
         self.filter_button.setStyleSheet(self.button_style)
 
+        # 선택한 어셈블리 하위 자산 일괄 내보내기 버튼
+        self.export_button = QPushButton("Export", MainWindow)
+        self.export_button.setMinimumSize(130, 40)
+        self.export_button.setStyleSheet(self.button_style)
+
         # 라디오 버튼 가로 레이아웃
         radio_layout = QHBoxLayout()
         radio_layout.addWidget(self.radio_image)
@@ -88,22 +115,40 @@ class MainWindowUI:
             lambda checked: self.checkbox_file.setStyleSheet("font-weight: bold;" if checked else "font-weight: normal;")
         )
 
-        # Filter 버튼과 FILE 체크박스를 같은 행에 배치
+        # Filter/Export 버튼과 FILE 체크박스를 같은 행에 배치
         filter_layout = QHBoxLayout()
         filter_layout.addStretch()
         filter_layout.addWidget(self.filter_button)
         filter_layout.addSpacing(10)
+        filter_layout.addWidget(self.export_button)
+        filter_layout.addSpacing(10)
         filter_layout.addWidget(self.checkbox_file)
         filter_layout.addStretch()
 
-        # 상단 라디오 버튼과 하단 Filter+FILE 레이아웃을 수직으로 배치
+        # 트리 펼치기/접기 (레벨 지정) 행
+        self.expand_level_spin = QSpinBox(MainWindow)
+        self.expand_level_spin.setRange(0, 30)
+        self.expand_level_spin.setValue(1)
+        self.expand_level_spin.setPrefix("Level ")
+        self.expand_level_button = QPushButton("Expand to Level", MainWindow)
+        self.expand_all_button = QPushButton("Expand All", MainWindow)
+
+        expand_layout = QHBoxLayout()
+        expand_layout.addStretch()
+        expand_layout.addWidget(self.expand_level_spin)
+        expand_layout.addWidget(self.expand_level_button)
+        expand_layout.addWidget(self.expand_all_button)
+        expand_layout.addStretch()
+
+        # 상단 라디오 버튼, Filter+FILE, 펼치기 레이아웃을 수직으로 배치
         radio_main_layout = QVBoxLayout()
         radio_main_layout.addLayout(radio_layout)
         radio_main_layout.addLayout(filter_layout)
+        radio_main_layout.addLayout(expand_layout)
 
         self.radio_group = QGroupBox("Select mode", MainWindow)
         self.radio_group.setStyleSheet(self.qgroupbox_style)
-        self.radio_group.setFixedHeight(180)
+        self.radio_group.setFixedHeight(220)
         self.radio_group.setLayout(radio_main_layout)
 
         
@@ -4,13 +4,17 @@ import sys
 import json
 import datetime
 import subprocess
-from PyQt5.QtWidgets import QMainWindow, QMessageBox
+from PyQt5.QtWidgets import QMainWindow, QMessageBox, QFileDialog, QProgressDialog
 from PyQt5.QtCore import QUrl, Qt
 from PyQt5.QtGui import QDesktopServices, QPixmap, QIcon
 from ui import MainWindowUI  # UI 구성부
 # tree_widget 모듈에서 MyTreeWidget를 import
 from tree_widget import MyTreeWidget
-from tree_manager import files_dict, display_part_info, apply_tree_view_styles
+from tree_manager import files_dict, asset_index, display_part_info, iter_tree_view_styles, get_base_path
+from preview_extractor import PreviewExtractor
+from log_panel import LogModel
+from asset_export import AssetExporter, collect_subtree_parts, collect_export_jobs
+from tree_scheduler import ChunkedTreeScheduler, iter_filter_items, iter_clear_filter, iter_expand_to_level
 
 class MainWindow(QMainWindow, MainWindowUI):
     def __init__(self):
@@ -22,17 +26,38 @@ class MainWindow(QMainWindow, MainWindowUI):
         self.memo_data = {}                   # { 파트번호: [ { "memo": 내용, "timestamp": 시간 }, ... ] }
         self.json_file_path = None            # JSON 파일 경로 (예: 01_excel/memo.json)
         self.df = None                        # Excel 데이터 (나중에 build_tree_view에서 설정)
+        self.bom_report = None                # BOM 무결성 검사 결과 (build_tree_view에서 설정)
+        self.part_matcher = None              # 파일명 퍼지 매칭 색인 (build_tree_view에서 설정)
+        self.other_part_matchers = []         # 로드된 다른 워크북의 퍼지 색인 (Workspace에서 설정)
+        self.exporter = None                  # 진행 중인 자산 내보내기 작업
+        self.export_progress = None           # 내보내기 진행 대화상자
+        self.workspace = None                 # 여러 워크북을 관리하는 Workspace (main에서 설정)
+        # 로그 모델 (링 버퍼 + 타이머 일괄 출력)
+        self.log_model = LogModel(capacity=self.logText.maximumBlockCount(), parent=self)
+        # 트리 전체 순회 작업(스타일/필터/펼치기)을 시간 분할 실행하는 스케줄러
+        self.tree_scheduler = ChunkedTreeScheduler(self.tree, budget_ms=8, parent=self)
+        # 3DXML 미리보기 추출기 (썸네일 캐시: 04_cache/3dxml_preview)
+        self.preview_extractor = PreviewExtractor(
+            os.path.join(get_base_path(), "04_cache", "3dxml_preview"), parent=self
+        )
         
         # 시그널과 슬롯 연결 (이벤트 핸들러 연결)
         self.tree.itemClicked.connect(self.on_tree_item_clicked)
         self.tree.itemDoubleClicked.connect(self.on_tree_item_double_clicked)
-        self.imageLabel.clicked.connect(self.load_image_for_current_part)
+        self.imageLabel.clicked.connect(self.on_image_label_clicked)
         self.radio_image.toggled.connect(self.on_radio_image_clicked)
         self.radio_3dxml.toggled.connect(self.on_radio_3dxml_clicked)
         self.radio_fbx.toggled.connect(self.on_radio_fbx_clicked)
         self.filter_button.toggled.connect(self.on_filter_button_toggled)
+        self.export_button.clicked.connect(self.on_export_button_clicked)
+        self.expand_level_button.clicked.connect(self.on_expand_level_clicked)
+        self.expand_all_button.clicked.connect(self.on_expand_all_clicked)
+        self.program_combo.currentTextChanged.connect(self.on_program_changed)
+        self.open_program_button.clicked.connect(self.on_open_program_clicked)
         self.memoSaveButton.clicked.connect(self.on_save_memo)
         self.memoClearButton.clicked.connect(self.on_clear_memo)
+        self.preview_extractor.previewReady.connect(self.on_preview_ready)
+        self.log_model.batchReady.connect(self.logText.appendPlainText)
     
     # ─── 이벤트 핸들러 구현 ─────────────────────────────
     def on_tree_item_clicked(self, item, column):
@@ -110,8 +135,11 @@ class MainWindow(QMainWindow, MainWindowUI):
     
     def load_image_for_current_part(self):
         part_no = self.current_part_no
-        if part_no in files_dict["image"]:
-            image_path = files_dict["image"][part_no]
+        image_path = files_dict["image"].get(part_no)
+        if image_path is None and part_no in files_dict["xml3d"]:
+            # PNG/JPG가 없으면 3DXML에 포함된 미리보기 썸네일 사용
+            image_path = self.preview_extractor.preview_for(files_dict["xml3d"][part_no])
+        if image_path is not None:
             if os.path.exists(image_path):
                 pixmap = QPixmap(image_path)
                 if not pixmap.isNull():
@@ -132,6 +160,44 @@ class MainWindow(QMainWindow, MainWindowUI):
             self.imageLabel.clear()
             self.imageLabel.setText("이미지가 없습니다.")
     
+    def current_asset_kind(self):
+        """선택된 라디오 모드에 해당하는 files_dict 키"""
+        if self.radio_3dxml.isChecked():
+            return "xml3d"
+        if self.radio_fbx.isChecked():
+            return "fbx"
+        return "image"
+    
+    def current_style(self):
+        """선택된 라디오 모드에 해당하는 트리 스타일 이름"""
+        if self.radio_3dxml.isChecked():
+            return "3dxml"
+        if self.radio_fbx.isChecked():
+            return "fbx"
+        return "image"
+    
+    def on_image_label_clicked(self):
+        """
+        이미지 패널 클릭 시 현재 모드의 다음 후보 파일(다른 리비전/뷰)로 전환.
+        전환된 파일은 더블 클릭/이미지 표시에 그대로 사용됨.
+        """
+        part_no = self.current_part_no
+        kind = self.current_asset_kind()
+        count = asset_index.count(kind, part_no)
+        if count > 1:
+            file_path = asset_index.cycle(kind, part_no)
+            position = asset_index.current_position(kind, part_no)
+            self.appendLog(f"[{kind}] {part_no}: {position + 1}/{count} {os.path.basename(file_path)}")
+        self.load_image_for_current_part()
+    
+    def on_preview_ready(self, xml_path, thumb_path):
+        """백그라운드에서 현재 파트의 3DXML 미리보기가 준비되면 이미지 패널 갱신"""
+        part_no = self.current_part_no
+        if part_no in files_dict["image"]:
+            return
+        if files_dict["xml3d"].get(part_no) == xml_path:
+            self.load_image_for_current_part()
+    
     def on_filter_button_toggled(self, checked):
         if checked:
             if self.radio_image.isChecked():
@@ -143,45 +209,164 @@ class MainWindow(QMainWindow, MainWindowUI):
             else:
                 mode = "image"
             self.filter_tree_items(self.tree, mode)
-            self.appendLog(f"Filter applied: {mode}")
         else:
             self.clear_tree_filter(self.tree)
-            self.appendLog("Filter cleared")
     
     def filter_tree_items(self, tree_widget, mode):
-        def filter_item(item):
-            part_no = item.text(0).upper()
-            visible_child = any(filter_item(item.child(i)) for i in range(item.childCount()))
-            visible_self = part_no in files_dict[mode]
-            visible = visible_self or visible_child
-            item.setHidden(not visible)
-            return visible
-        for i in range(tree_widget.topLevelItemCount()):
-            filter_item(tree_widget.topLevelItem(i))
+        # 필터 적용/해제는 같은 key("filter")를 사용하므로 나중 요청이 이전 요청을 취소함
+        self.tree_scheduler.submit(
+            "filter", iter_filter_items(tree_widget, files_dict[mode]),
+            lambda: self.appendLog(f"Filter applied: {mode}")
+        )
     
     def clear_tree_filter(self, tree_widget):
-        def clear_item(item):
-            item.setHidden(False)
-            for i in range(item.childCount()):
-                clear_item(item.child(i))
-        for i in range(tree_widget.topLevelItemCount()):
-            clear_item(tree_widget.topLevelItem(i))
+        self.tree_scheduler.submit(
+            "filter", iter_clear_filter(tree_widget),
+            lambda: self.appendLog("Filter cleared")
+        )
+    
+    def schedule_tree_styles(self, style):
+        """모드 스타일 적용 (빠르게 모드를 바꾸면 이전 스타일 작업은 취소됨)"""
+        self.tree_scheduler.submit("style", iter_tree_view_styles(self.tree, style))
+    
+    def on_expand_level_clicked(self):
+        level = self.expand_level_spin.value()
+        self.tree_scheduler.submit(
+            "expand", iter_expand_to_level(self.tree, level),
+            lambda: self.appendLog(f"Expanded to level {level}")
+        )
+    
+    def on_expand_all_clicked(self):
+        self.tree_scheduler.submit(
+            "expand", iter_expand_to_level(self.tree),
+            lambda: self.appendLog("Expanded all")
+        )
+    
+    def refresh_program_list(self):
+        """워크스페이스의 프로그램 목록을 콤보박스에 반영 (활성 프로그램 선택)"""
+        self.program_combo.blockSignals(True)
+        self.program_combo.clear()
+        if self.workspace is not None:
+            self.program_combo.addItems(self.workspace.names())
+            if self.workspace.active is not None:
+                self.program_combo.setCurrentText(self.workspace.active)
+        self.program_combo.blockSignals(False)
+    
+    def switch_program(self, name):
+        if self.workspace is None:
+            return
+        self.reset_part_view()
+        self.workspace.switch(name)
+        self.refresh_program_list()
+    
+    def reset_part_view(self):
+        """선택된 파트와 관련된 표시(이미지, 파트 정보, 메모)를 초기화"""
+        self.current_part_no = None
+        self.imageLabel.clear()
+        self.imageLabel.setText("이미지가 여기에 표시됩니다.")
+        self.partInfoLabel.clear()
+        self.memoOutput.clear()
+        self.memoText.clear()
+    
+    def on_program_changed(self, name):
+        if name:
+            self.switch_program(name)
+    
+    def on_open_program_clicked(self):
+        if self.workspace is None:
+            return
+        excel_path, _ = QFileDialog.getOpenFileName(
+            self, "워크북 열기", os.path.join(get_base_path(), "01_excel"), "Excel (*.xlsx)"
+        )
+        if not excel_path:
+            return
+        self.switch_program(self.workspace.add_program(excel_path))
+    
+    def on_export_button_clicked(self):
+        """선택한 노드 하위의 이미지/3DXML/FBX 파일을 폴더 또는 ZIP으로 내보내기"""
+        if self.exporter is not None:
+            QMessageBox.information(self, "알림", "내보내기가 이미 진행 중입니다.")
+            return
+        item = self.tree.currentItem()
+        if item is None:
+            QMessageBox.warning(self, "경고", "먼저 내보낼 어셈블리를 선택하세요.")
+            return
+        
+        root_part = item.text(0).strip().upper()
+        jobs, missing = collect_export_jobs(collect_subtree_parts(item), asset_index)
+        if not jobs:
+            QMessageBox.information(self, "알림", f"'{root_part}' 하위에 내보낼 파일이 없습니다.")
+            return
+        
+        box = QMessageBox(self)
+        box.setWindowTitle("내보내기")
+        box.setText(f"'{root_part}' 하위 파일 {len(jobs)}개를 내보냅니다.")
+        folder_button = box.addButton("Folder", QMessageBox.AcceptRole)
+        zip_button = box.addButton("ZIP", QMessageBox.AcceptRole)
+        box.addButton(QMessageBox.Cancel)
+        box.exec_()
+        if box.clickedButton() == zip_button:
+            destination, _ = QFileDialog.getSaveFileName(self, "ZIP 저장", f"{root_part}.zip", "ZIP (*.zip)")
+            as_zip = True
+        elif box.clickedButton() == folder_button:
+            parent_dir = QFileDialog.getExistingDirectory(self, "내보낼 폴더 선택")
+            destination = os.path.join(parent_dir, root_part) if parent_dir else ""
+            as_zip = False
+        else:
+            return
+        if not destination:
+            return
+        
+        self.export_progress = QProgressDialog(f"{root_part} 내보내는 중...", "취소", 0, len(jobs), self)
+        self.export_progress.setWindowModality(Qt.WindowModal)
+        self.export_progress.setMinimumDuration(0)
+        self.exporter = AssetExporter(root_part, jobs, missing, destination, as_zip, parent=self)
+        self.exporter.progress.connect(self.on_export_progress)
+        self.exporter.finished.connect(self.on_export_finished)
+        self.export_progress.canceled.connect(self.exporter.cancel)
+        self.appendLog(f"[Export] {root_part}: 파일 {len(jobs)}개 → {destination}")
+        self.exporter.start()
+    
+    def on_export_progress(self, done, total):
+        if self.export_progress is not None:
+            self.export_progress.setValue(done)
+    
+    def on_export_finished(self, manifest):
+        if self.export_progress is not None:
+            self.export_progress.canceled.disconnect()
+            self.export_progress.close()
+            self.export_progress = None
+        self.exporter = None
+        
+        copied = sum(1 for entry in manifest["files"] if entry["status"] == "copied")
+        failed = [entry for entry in manifest["files"] if entry["status"].startswith("error")]
+        if manifest["error"]:
+            self.appendLog(f"[Export] 실패: {manifest['error']}", "ERROR")
+        elif manifest["cancelled"]:
+            self.appendLog(f"[Export] 취소됨 (복사 {copied}개)", "WARNING")
+        else:
+            self.appendLog(
+                f"[Export] 완료: 복사 {copied}개, 실패 {len(failed)}개, "
+                f"자산 없는 파트 {len(manifest['missing_parts'])}개 → {manifest['destination']}"
+            )
+        for entry in failed:
+            self.appendLog(f"[Export] {entry['source']}: {entry['status']}", "ERROR")
     
     def on_radio_image_clicked(self, checked):
         if checked:
-            apply_tree_view_styles(self.tree, "image")
+            self.schedule_tree_styles("image")
             if self.filter_button.isChecked():
                 self.reset_filter_button()
     
     def on_radio_3dxml_clicked(self, checked):
         if checked:
-            apply_tree_view_styles(self.tree, "3dxml")
+            self.schedule_tree_styles("3dxml")
             if self.filter_button.isChecked():
                 self.reset_filter_button()
     
     def on_radio_fbx_clicked(self, checked):
         if checked:
-            apply_tree_view_styles(self.tree, "fbx")
+            self.schedule_tree_styles("fbx")
             if self.filter_button.isChecked():
                 self.reset_filter_button()
     
@@ -189,8 +374,14 @@ class MainWindow(QMainWindow, MainWindowUI):
         if self.filter_button.isChecked():
             self.filter_button.setChecked(False)
     
-    def appendLog(self, message):
-        self.logText.append(message)
+    def appendLog(self, message, level="INFO"):
+        self.log_model.append(message, level)
+    
+    def closeEvent(self, event):
+        # 남은 로그를 내보내고 파일 싱크 정리
+        self.log_model.flush()
+        self.log_model.close_file_sink()
+        super().closeEvent(event)
     
     def on_save_memo(self):
         if not self.current_part_no:
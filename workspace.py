@@ -0,0 +1,199 @@
+# workspace.py
+import os
+from collections import OrderedDict
+import tree_manager
+from tree_manager import build_tree_view
+
+# ─────────────────────────────────────────────────────────────
+# 여러 워크북(기체 형상)을 동시에 보관하는 워크스페이스
+# ─────────────────────────────────────────────────────────────
+DEFAULT_MEMORY_BUDGET_MB = 1024
+NODE_MEMORY_BYTES = 400   # 트리 노드 하나당 대략적인 메모리 (QTreeWidgetItem + 래퍼 + 딕셔너리 항목)
+
+
+def memo_path_for(excel_path):
+    """
+    워크북별 메모 파일 경로.
+    기존 호환을 위해 data.xlsx는 같은 폴더의 memo.json, 그 외에는 <파일명>_memo.json
+    """
+    folder, fname = os.path.split(excel_path)
+    stem = os.path.splitext(fname)[0]
+    if fname.lower() == "data.xlsx":
+        return os.path.join(folder, "memo.json")
+    return os.path.join(folder, f"{stem}_memo.json")
+
+
+class ProgramState:
+    """
+    워크북 하나의 상태 (트리 노드, g_NodeDictionary, 엑셀 데이터, 퍼지 색인, 메모).
+    비활성 상태에서는 트리 노드를 트리뷰에서 떼어 내어 보관하므로 다시 활성화할 때 재구성이 필요 없음.
+    """
+
+    def __init__(self, name, excel_path, memo_path):
+        self.name = name
+        self.excel_path = excel_path
+        self.memo_path = memo_path
+        self.loaded = False
+        self.root_items = []          # 트리뷰에서 떼어 낸 최상위 노드
+        self.node_dictionary = {}     # 파트넘버 -> 트리 아이템 (tree_manager.g_NodeDictionary)
+        self.node_count = 0
+        self.df = None
+        self.part_matcher = None
+        self.bom_report = None
+        self.memo_data = None
+        self.memory_bytes = 0
+
+    def estimate_memory(self):
+        """엑셀 데이터 + 트리 노드 기준 대략적인 메모리 사용량 (바이트)"""
+        total = self.node_count * NODE_MEMORY_BYTES
+        if self.df is not None:
+            total += int(self.df.memory_usage(deep=True).sum())
+        return total
+
+    def unload(self):
+        """로드된 데이터를 모두 해제 (다음 활성화 시 엑셀에서 다시 로드)"""
+        self.loaded = False
+        self.root_items = []
+        self.node_dictionary = {}
+        self.node_count = 0
+        self.df = None
+        self.part_matcher = None
+        self.bom_report = None
+        self.memo_data = None
+        self.memory_bytes = 0
+
+
+class Workspace:
+    """
+    여러 ProgramState를 최근 사용 순서(LRU)로 관리.
+    최근 사용한 프로그램은 트리 노드째로 보관하여 즉시 전환하고,
+    로드된 프로그램의 메모리 합계가 memory_budget_mb를 넘으면
+    가장 오래 사용하지 않은 비활성 프로그램부터 해제함.
+    자산 인덱스(tree_manager.asset_index)는 모든 프로그램이 공유하며, 새로 로드할 때마다
+    다시 스캔함 (로드된 다른 프로그램의 퍼지 색인도 함께 사용).
+    """
+
+    def __init__(self, window, memory_budget_mb=DEFAULT_MEMORY_BUDGET_MB):
+        self.window = window
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.programs = OrderedDict()   # 이름 -> ProgramState (마지막이 가장 최근 사용)
+        self.active = None              # 활성 프로그램 이름
+
+    def add_program(self, excel_path, memo_path=None):
+        """워크북 등록 (이미 등록된 경로면 기존 이름 반환)"""
+        excel_path = os.path.abspath(excel_path)
+        for name, state in self.programs.items():
+            if state.excel_path == excel_path:
+                return name
+        name = os.path.splitext(os.path.basename(excel_path))[0]
+        base_name, counter = name, 2
+        while name in self.programs:
+            name = f"{base_name} ({counter})"
+            counter += 1
+        self.programs[name] = ProgramState(name, excel_path, memo_path or memo_path_for(excel_path))
+        # 새로 등록한 프로그램은 가장 오래된 쪽에 둠 (사용 시 최근으로 이동)
+        self.programs.move_to_end(name, last=False)
+        return name
+
+    def names(self):
+        return sorted(self.programs)
+
+    def loaded_memory(self):
+        return sum(state.memory_bytes for state in self.programs.values() if state.loaded)
+
+    def switch(self, name):
+        """활성 프로그램 전환. 로드된 프로그램은 즉시, 아니면 엑셀에서 로드"""
+        if name == self.active or name not in self.programs:
+            return
+        window = self.window
+        # 필터는 떼어 내기 전에 해제를 끝까지 적용 (보관 중인 노드가 숨김 상태로 남지 않도록).
+        # 버튼이 이미 꺼져 있어도 진행 중인 해제 작업이 있을 수 있으므로 항상 run_now
+        if window.filter_button.isChecked():
+            window.reset_filter_button()
+        window.tree_scheduler.run_now("filter")
+        window.tree_scheduler.cancel_all()
+        if self.active is not None:
+            self._detach(self.programs[self.active])
+
+        state = self.programs[name]
+        self.active = name
+        self.programs.move_to_end(name)
+        if state.loaded:
+            self._attach(state)
+            window.appendLog(f"[Workspace] '{name}' 전환 (캐시)")
+        elif self._load(state):
+            window.appendLog(f"[Workspace] '{name}' 로드 ({state.memory_bytes / 1024 / 1024:.1f} MB)")
+        else:
+            window.appendLog(f"[Workspace] '{name}' 로드 실패", "ERROR")
+        # 현재 모드로 스타일 다시 적용 (보관 중에 모드가 바뀌었을 수 있음)
+        window.schedule_tree_styles(window.current_style())
+        self._evict()
+
+    def _load(self, state):
+        """
+        엑셀에서 트리를 새로 구성. 실패하면(파일 없음, 루트 없음) 창을 빈 상태로 두고
+        state는 로드되지 않은 상태로 남겨 다음 활성화 때 다시 시도함.
+        """
+        window = self.window
+        window.json_file_path = state.memo_path
+        window.load_memo_data()
+        window.df = None
+        window.bom_report = None
+        window.part_matcher = None
+        tree_manager.g_NodeDictionary = {}
+        tree_manager.nodeCount = 0
+        # 자산 폴더는 매번 다시 스캔하되, 다른 프로그램의 파트에 연결된 파일도 유지되도록
+        # 로드된 다른 프로그램의 퍼지 색인을 함께 넘김
+        window.other_part_matchers = [
+            other.part_matcher for other in self.programs.values()
+            if other is not state and other.loaded and other.part_matcher is not None
+        ]
+
+        if os.path.exists(state.excel_path):
+            build_tree_view(state.excel_path, window)
+        else:
+            window.appendLog(f"[Workspace] 엑셀 파일을 찾을 수 없습니다: {state.excel_path}", "ERROR")
+        if window.tree.topLevelItemCount() == 0:
+            return False
+        state.loaded = True
+        state.node_count = tree_manager.nodeCount
+        state.df = window.df
+        state.memory_bytes = state.estimate_memory()
+        return True
+
+    def _detach(self, state):
+        """활성 프로그램의 트리 노드와 상태를 창에서 떼어 내어 보관"""
+        window = self.window
+        tree = window.tree
+        state.root_items = [tree.takeTopLevelItem(0) for _ in range(tree.topLevelItemCount())]
+        state.node_dictionary = tree_manager.g_NodeDictionary
+        state.node_count = tree_manager.nodeCount
+        state.df = window.df
+        state.part_matcher = window.part_matcher
+        state.bom_report = window.bom_report
+        state.memo_data = window.memo_data
+        state.memory_bytes = state.estimate_memory()
+
+    def _attach(self, state):
+        """보관된 트리 노드와 상태를 창에 다시 연결"""
+        window = self.window
+        window.tree.addTopLevelItems(state.root_items)
+        state.root_items = []
+        tree_manager.g_NodeDictionary = state.node_dictionary
+        tree_manager.nodeCount = state.node_count
+        window.df = state.df
+        window.part_matcher = state.part_matcher
+        window.bom_report = state.bom_report
+        window.json_file_path = state.memo_path
+        window.memo_data = state.memo_data
+
+    def _evict(self):
+        """메모리 예산을 넘으면 가장 오래 사용하지 않은 비활성 프로그램부터 해제"""
+        for name in list(self.programs):
+            if self.loaded_memory() <= self.memory_budget:
+                return
+            state = self.programs[name]
+            if name == self.active or not state.loaded:
+                continue
+            state.unload()
+            self.window.appendLog(f"[Workspace] 메모리 예산 초과로 '{name}' 해제")